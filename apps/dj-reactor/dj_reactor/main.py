@@ -6,12 +6,13 @@ Compatible with ReachyMiniApp format for HuggingFace/dashboard distribution.
 """
 
 import math
+import os
 import time
 import threading
 import logging
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
-from collections import deque
 
 import numpy as np
 import gradio as gr
@@ -21,8 +22,18 @@ try:
 except ImportError:
     sd = None
 
+try:
+    from scipy.fft import rfft as _rfft, next_fast_len  # pocketfft, caches plans between calls
+except ImportError:
+    from numpy.fft import rfft as _rfft
+    next_fast_len = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 from reachy_mini import ReachyMini, ReachyMiniApp
-from reachy_mini.utils import create_head_pose
 
 logger = logging.getLogger(__name__)
 
@@ -33,9 +44,24 @@ logger = logging.getLogger(__name__)
 BASS_RANGE = (20, 250)
 MID_RANGE = (250, 2000)
 TREBLE_RANGE = (2000, 12000)
+BAND_NORMALIZATION = (3.0, 2.0, 1.0)  # bass/mid/treble divisors for loopback audio
+ENERGY_HISTORY_SIZE = 10  # analysis frames (chunk_size) of RMS history for onset detection
+FEATURE_SLOTS = 4  # preallocated AudioFeatures the analyzer rotates through
+CAPTURE_SLOTS = 8  # captured blocks buffered for the analysis thread
+BEAT_HISTORY_SIZE = 50  # beat timestamps kept for BPM estimation
+DEG2RAD = math.pi / 180.0
+
+# Smallest change per commanded DoF worth a goto_target (mm, deg, rad, rad)
+COMMAND_DEADBAND = {
+    'head_z': 0.5,
+    'head_roll': 0.5,
+    'body_yaw': 0.5 * DEG2RAD,
+    'antenna_left': 0.02,
+    'antenna_right': 0.02,
+}
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GenrePreset:
     """Movement characteristics for a music genre."""
     name: str
@@ -103,7 +129,7 @@ GENRE_PRESETS = {
 # Audio Analysis
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class AudioFeatures:
     """Extracted audio features for a single frame."""
     bass: float = 0.0
@@ -115,102 +141,341 @@ class AudioFeatures:
     bpm: float = 120.0
     beat_phase: float = 0.0  # 0-1, position within current beat cycle
     is_silent: bool = True
+    seq: int = 0  # increments once per analyzed block
+    # beat_detected only lasts one hop; readers slower than the hop rate
+    # compare beat_count with the value they last saw instead
+    beat_count: int = 0  # beats detected since the analyzer started
+    beat_strength: float = 0.0  # onset strength of the most recent beat
+
+
+def _window_and_energy(frame, window, out, start):
+    """Write frame * window into out and return sum(frame[start:] ** 2) in one pass."""
+    for i in range(start):
+        out[i] = frame[i] * window[i]
+    energy = 0.0
+    for i in range(start, frame.shape[0]):
+        x = frame[i]
+        energy += x * x
+        out[i] = x * window[i]
+    return energy
+
+
+if njit is not None:
+    # nogil: the kernel only touches raw buffers, so the UI and dance
+    # threads can run while the audio thread is inside it
+    _window_and_energy = njit(cache=True, fastmath=True, nogil=True)(_window_and_energy)
+else:
+    def _window_and_energy(frame, window, out, start):  # noqa: F811 - NumPy fallback
+        """Write frame * window into out and return sum(frame[start:] ** 2)."""
+        np.multiply(frame, window, out=out)
+        tail = frame[start:]
+        return float(np.dot(tail, tail))
+
+
+def _band_slice(freqs: np.ndarray, low: float, high: float) -> slice:
+    """Contiguous slice of FFT bins whose frequency lies in [low, high]."""
+    start = int(np.searchsorted(freqs, low, side="left"))
+    stop = int(np.searchsorted(freqs, high, side="right"))
+    return slice(start, stop)
+
+
+@lru_cache(maxsize=8)
+def _analysis_tables(chunk_size: int, sample_rate: int):
+    """FFT size, band reduction tables and window for an analyzer config.
+
+    Blocks are zero-padded to the next fast transform length (scipy's
+    next_fast_len, or a power of two without scipy). Band bins are
+    contiguous, so all three band sums come from one np.add.reduceat over
+    [lo, hi) edge pairs (odd segments are gaps and get discarded). Cached
+    and marked read-only, so analyzers recreated on every start share them.
+    """
+    if next_fast_len is not None:
+        fft_size = next_fast_len(chunk_size, real=True)
+    else:
+        fft_size = 1 << (chunk_size - 1).bit_length()
+    freqs = np.fft.rfftfreq(fft_size, 1.0 / sample_rate)
+    bands = [_band_slice(freqs, *r) for r in (BASS_RANGE, MID_RANGE, TREBLE_RANGE)]
+    edges = np.array([i for b in bands for i in (b.start, b.stop)], dtype=np.intp)
+    widths = edges[1::2] - edges[::2]
+    band_stop = int(edges[-1])
+    band_idx = np.minimum(edges[:-1], max(band_stop - 1, 0))
+    # Mean + loopback normalization folded into one scale; empty bands read 0
+    band_scale = np.divide(
+        1.0, widths * np.asarray(BAND_NORMALIZATION),
+        out=np.zeros(len(bands), dtype=np.float32), where=widths > 0,
+    )
+    window = np.hanning(chunk_size).astype(np.float32)
+    for table in (band_idx, band_scale, window):
+        table.setflags(write=False)
+    return fft_size, band_stop, band_idx, band_scale, window
+
+
+ANALYSIS_RT_PRIORITY = 10  # low SCHED_FIFO priority: above the UI, below audio servers
+
+
+def _raise_thread_priority():
+    """Best-effort real-time scheduling for the calling thread.
+
+    Keeps the analysis worker from being starved by the Gradio thread. Needs
+    Linux plus CAP_SYS_NICE / rtprio limits; otherwise stays at normal priority.
+    """
+    try:
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(ANALYSIS_RT_PRIORITY))
+    except (AttributeError, OSError) as e:
+        logger.debug(f"Real-time priority unavailable: {e}")
 
 
 class AudioAnalyzer:
     """Real-time audio analysis for beat detection and frequency bands."""
 
     def __init__(self, sample_rate: int = 44100, chunk_size: int = 2048,
-                 device_index: Optional[int] = None, sensitivity: float = 0.6):
+                 device_index: Optional[int] = None, sensitivity: float = 0.6,
+                 hop_size: int = 512):
         self.sample_rate = sample_rate
         self.chunk_size = chunk_size
+        # Capture in small hops for low latency; the FFT still sees the last
+        # chunk_size samples, slid forward by one hop per callback
+        self.hop_size = min(hop_size, chunk_size)
         self.device_index = device_index
         self.sensitivity = sensitivity
-
-        # FFT setup
-        freqs = np.fft.rfftfreq(chunk_size, 1.0 / sample_rate)
-        self.bass_bins = np.where((freqs >= BASS_RANGE[0]) & (freqs <= BASS_RANGE[1]))[0]
-        self.mid_bins = np.where((freqs >= MID_RANGE[0]) & (freqs <= MID_RANGE[1]))[0]
-        self.treble_bins = np.where((freqs >= TREBLE_RANGE[0]) & (freqs <= TREBLE_RANGE[1]))[0]
-
-        # Beat tracking
-        self.energy_history = deque(maxlen=10)
-        self.beat_times = deque(maxlen=50)
+        self._apply_sensitivity()
+
+        # FFT setup (shared, read-only tables; see _analysis_tables)
+        self.fft_size, self._band_stop, self._band_idx, self._band_scale, self._window = \
+            _analysis_tables(chunk_size, sample_rate)
+
+        # Preallocated buffers, reused for every block. The whole DSP chain
+        # stays float32 to match the capture format (scipy's rfft keeps
+        # float32 -> complex64)
+        self._frame = np.zeros(chunk_size, dtype=np.float32)
+        self._fft_in = np.zeros(self.fft_size, dtype=np.float32)
+        self._spectrum = np.empty(self.fft_size // 2 + 1, dtype=np.float32)
+        self._band_sums = np.empty(len(self._band_idx), dtype=np.float32)
+        self._bands = np.empty(len(self._band_scale), dtype=np.float32)
+
+        # Beat tracking - energy history is a fixed ring with a running sum,
+        # one entry per hop, spanning ENERGY_HISTORY_SIZE analysis frames
+        self._energy_len = ENERGY_HISTORY_SIZE * max(1, chunk_size // self.hop_size)
+        self._energy_ring = [0.0] * self._energy_len
+        self._energy_sum = 0.0
+        self._energy_idx = 0
+        self._energy_count = 0
+        # Beat times live in a mirrored ring: each write lands at i and
+        # i + BEAT_HISTORY_SIZE, so the most recent k beats are always one
+        # contiguous slice ending at head + BEAT_HISTORY_SIZE
+        self._beat_ring = np.zeros(2 * BEAT_HISTORY_SIZE)
+        self._beat_head = 0
+        self._beat_count = 0
+        self._intervals = np.empty(BEAT_HISTORY_SIZE - 1)
+        self._interval_scratch = np.empty(BEAT_HISTORY_SIZE - 1)
         self.last_beat_time = 0.0
+        self._beats_total = 0
+        self._last_beat_strength = 0.0
         self.estimated_bpm = 120.0
         self.beat_interval = 0.5  # seconds between beats (60/120 BPM)
 
+        # Published features: the analysis thread fills the next preallocated
+        # slot in place, then swaps the reference. Each slot's seq doubles as
+        # a seqlock (-1 while being written), so get_latest() can hand out a
+        # consistent copy however long the reader holds it.
+        self._feature_slots = [AudioFeatures() for _ in range(FEATURE_SLOTS)]
+        self._slot_idx = 0
+        self._seq = 0
+        self._new_features = threading.Event()
+
         # State
         self.is_running = False
         self.stream = None
-        self.latest_features = AudioFeatures()
-        self.start_time = 0.0
-
-    def _audio_callback(self, indata, frames, time_info, status):
-        """Process incoming audio data."""
-        if len(indata.shape) > 1:
-            audio = np.mean(indata, axis=1)
+        self.latest_features = self._feature_slots[0]
+        # Stream clock: PortAudio's ADC timestamp of each block, relative to
+        # the first one. Host APIs that don't report it (0.0) fall back to
+        # counting samples, which is just as drift-free
+        self._clock_origin: Optional[float] = None
+        self._samples_seen = 0
+
+        # Capture ring between the PortAudio callback and the analysis
+        # thread. The callback is the only writer of _written, the thread
+        # the only writer of _analyzed
+        self._capture = np.zeros((CAPTURE_SLOTS, chunk_size), dtype=np.float32)
+        self._capture_len = [0] * CAPTURE_SLOTS
+        self._capture_time = [0.0] * CAPTURE_SLOTS
+        self._written = 0
+        self._analyzed = 0
+        self._capture_ready = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+
+    def _stream_time(self, time_info, n: int) -> float:
+        """Seconds since capture started, on the audio clock."""
+        adc = time_info.inputBufferAdcTime if time_info is not None else 0.0
+        if self._clock_origin is None:
+            self._clock_origin = adc if adc > 0.0 else -1.0
+        if self._clock_origin >= 0.0:
+            t = adc - self._clock_origin
         else:
-            audio = indata.flatten()
+            t = self._samples_seen / self.sample_rate
+        self._samples_seen += n
+        return t
 
-        current_time = time.time() - self.start_time
-
-        # RMS energy
-        rms = np.sqrt(np.mean(audio ** 2))
+    def _audio_callback(self, indata, frames, time_info, status):
+        """Hand incoming audio to the analysis thread.
+
+        Runs on PortAudio's realtime thread, so it only copies the block
+        into the next capture slot and signals. The stream is opened mono,
+        so the single channel is taken as a view - no downmix.
+        """
+        written = self._written
+        k = written % CAPTURE_SLOTS
+        n = min(len(indata), self.chunk_size)
+        audio = indata[:, 0] if indata.ndim > 1 else indata.reshape(-1)
+        self._capture[k, :n] = audio[-n:]
+        self._capture_len[k] = n
+        self._capture_time[k] = self._stream_time(time_info, len(indata))
+        self._written = written + 1  # publish after the slot is complete
+        self._capture_ready.set()
+
+    def _analysis_loop(self):
+        """Analysis thread: process captured blocks as they arrive."""
+        _raise_thread_priority()
+        while self.is_running:
+            if self._capture_ready.wait(timeout=0.5):
+                self._capture_ready.clear()
+                self._drain_capture()
+
+    def _drain_capture(self):
+        """Analyze every captured block not yet processed, oldest first."""
+        written = self._written
+        if written - self._analyzed >= CAPTURE_SLOTS:
+            # Fell a full ring behind; the oldest slot may be mid-overwrite
+            self._analyzed = written - CAPTURE_SLOTS + 1
+        while self._analyzed < written:
+            k = self._analyzed % CAPTURE_SLOTS
+            self._analyze(self._capture[k, :self._capture_len[k]], self._capture_time[k])
+            self._analyzed += 1
+
+    def _analyze(self, audio: np.ndarray, current_time: float):
+        """Run FFT, band and beat analysis on one block and publish features."""
+        # Slide the analysis frame forward by the new hop
+        frame = self._frame
+        n = len(audio)
+        frame[:-n] = frame[n:]
+        frame[-n:] = audio
+
+        # Window into the FFT buffer (its zero tail pads to fft_size) and
+        # accumulate RMS energy of the new samples in one pass
+        energy = _window_and_energy(frame, self._window, self._fft_in[:self.chunk_size],
+                                    self.chunk_size - n)
+        rms = math.sqrt(energy / n)
         is_silent = rms < 0.001
 
         # FFT analysis
-        windowed = audio * np.hanning(len(audio))
-        if len(windowed) < self.chunk_size:
-            windowed = np.pad(windowed, (0, self.chunk_size - len(windowed)))
-        spectrum = np.abs(np.fft.rfft(windowed[:self.chunk_size]))
-
-        # Extract band energies (normalized for loopback audio)
-        bass = min(np.mean(spectrum[self.bass_bins]) / 3.0, 1.0) if len(self.bass_bins) > 0 else 0
-        mid = min(np.mean(spectrum[self.mid_bins]) / 2.0, 1.0) if len(self.mid_bins) > 0 else 0
-        treble = min(np.mean(spectrum[self.treble_bins]) / 1.0, 1.0) if len(self.treble_bins) > 0 else 0
-
-        # Beat detection with sensitivity
-        self.energy_history.append(rms)
+        spectrum = np.abs(_rfft(self._fft_in), out=self._spectrum)
+
+        # Extract band energies (normalized for loopback audio), in place
+        np.add.reduceat(spectrum[:self._band_stop], self._band_idx, out=self._band_sums)
+        bands = np.multiply(self._band_sums[::2], self._band_scale, out=self._bands)
+        bass, mid, treble = np.minimum(bands, 1.0, out=bands).tolist()
+
+        beat_detected, onset_strength = self._detect_beat(rms, current_time)
+
+        # Calculate beat phase (0-1 position within beat cycle)
+        time_since_beat = current_time - self.last_beat_time
+        beat_phase = (time_since_beat / self.beat_interval) % 1.0 if self.beat_interval > 0 else 0.0
+
+        self._slot_idx = (self._slot_idx + 1) % FEATURE_SLOTS
+        f = self._feature_slots[self._slot_idx]
+        f.seq = -1  # slot is being rewritten
+        f.bass = bass
+        f.mid = mid
+        f.treble = treble
+        f.rms = min(rms * 10, 1.0)
+        f.beat_detected = beat_detected
+        f.onset_strength = onset_strength
+        f.bpm = self.estimated_bpm
+        f.beat_phase = beat_phase
+        f.is_silent = is_silent
+        f.beat_count = self._beats_total
+        f.beat_strength = self._last_beat_strength
+        self._seq += 1
+        f.seq = self._seq
+        self.latest_features = f  # single reference store publishes the frame
+        self._new_features.set()
+
+    def _detect_beat(self, rms: float, current_time: float) -> tuple[bool, float]:
+        """Onset-based beat detection on the frame's precomputed RMS.
+
+        Returns (beat_detected, onset_strength).
+        """
+        self._push_energy(rms)
         beat_detected = False
         onset_strength = 0.0
-        onset_threshold = 1.1 + (1.0 - self.sensitivity) * 0.5  # Higher sensitivity = lower threshold
-        min_interval = 0.2 + (1.0 - self.sensitivity) * 0.2
+        onset_threshold = self._onset_threshold
+        min_interval = self._min_interval
 
-        if len(self.energy_history) >= 3:
-            avg_energy = np.mean(list(self.energy_history)[:-1])
+        if self._energy_count >= 3:
+            # Mean of the history excluding the frame just pushed
+            avg_energy = (self._energy_sum - rms) / (self._energy_count - 1)
             onset = rms / (avg_energy + 1e-10)
             onset_strength = min(onset / onset_threshold, 2.0)  # Normalized onset strength
             if onset > onset_threshold and (current_time - self.last_beat_time) > min_interval and rms > 0.002:
                 beat_detected = True
-                self.beat_times.append(current_time)
+                self._beats_total += 1
+                self._last_beat_strength = onset_strength
+                self._push_beat(current_time)
                 self.last_beat_time = current_time
                 self._update_bpm()
 
-        # Calculate beat phase (0-1 position within beat cycle)
-        time_since_beat = current_time - self.last_beat_time
-        beat_phase = (time_since_beat / self.beat_interval) % 1.0 if self.beat_interval > 0 else 0.0
-
-        self.latest_features = AudioFeatures(
-            bass=bass, mid=mid, treble=treble,
-            rms=min(rms * 10, 1.0),
-            beat_detected=beat_detected,
-            onset_strength=onset_strength,
-            bpm=self.estimated_bpm,
-            beat_phase=beat_phase,
-            is_silent=is_silent
-        )
+        return beat_detected, onset_strength
+
+    def _push_energy(self, rms: float):
+        """Add an RMS value to the energy ring, keeping the running sum in O(1)."""
+        idx = self._energy_idx
+        self._energy_sum += rms - self._energy_ring[idx]
+        self._energy_ring[idx] = rms
+        idx = (idx + 1) % self._energy_len
+        if idx == 0:
+            # Resync once per lap so float error can't accumulate
+            self._energy_sum = sum(self._energy_ring)
+        self._energy_idx = idx
+        if self._energy_count < self._energy_len:
+            self._energy_count += 1
+
+    def _push_beat(self, t: float):
+        """Record a beat time in the mirrored ring."""
+        head = self._beat_head
+        self._beat_ring[head] = t
+        self._beat_ring[head + BEAT_HISTORY_SIZE] = t
+        self._beat_head = (head + 1) % BEAT_HISTORY_SIZE
+        if self._beat_count < BEAT_HISTORY_SIZE:
+            self._beat_count += 1
+
+    @property
+    def beat_times(self) -> np.ndarray:
+        """Recorded beat times, oldest first (a view into the ring)."""
+        end = self._beat_head + BEAT_HISTORY_SIZE
+        return self._beat_ring[end - self._beat_count:end]
+
+    def _median(self, values: np.ndarray) -> float:
+        """np.median via an in-place partition of a scratch copy (no sort, no alloc)."""
+        n = len(values)
+        k = n // 2
+        scratch = self._interval_scratch[:n]
+        np.copyto(scratch, values)
+        if n % 2:
+            scratch.partition(k)
+            return float(scratch[k])
+        scratch.partition((k - 1, k))
+        return float(scratch[k - 1] + scratch[k]) / 2.0
 
     def _update_bpm(self):
         """Estimate BPM from beat times."""
-        if len(self.beat_times) < 4:
+        if self._beat_count < 4:
             return
-        times = list(self.beat_times)
-        intervals = [times[i+1] - times[i] for i in range(len(times) - 1)]
-        median = np.median(intervals)
-        valid = [i for i in intervals if 0.5 * median < i < 2 * median]
-        if valid:
-            avg_interval = np.mean(valid)
+        times = self.beat_times
+        intervals = np.subtract(times[1:], times[:-1], out=self._intervals[:len(times) - 1])
+        median = self._median(intervals)
+        valid = intervals[(intervals > 0.5 * median) & (intervals < 2 * median)]
+        if valid.size:
+            avg_interval = float(valid.mean())
             self.beat_interval = avg_interval
             self.estimated_bpm = max(60, min(200, 60.0 / avg_interval))
 
@@ -218,13 +483,19 @@ class AudioAnalyzer:
         """Start audio capture."""
         if self.is_running or sd is None:
             return
-        self.start_time = time.time()
+        self._clock_origin = None
+        self._samples_seen = 0
+        self._written = self._analyzed = 0
         self.is_running = True
+        self._worker = threading.Thread(target=self._analysis_loop, daemon=True)
+        self._worker.start()
         self.stream = sd.InputStream(
             device=self.device_index,
             channels=1,
+            dtype="float32",
             samplerate=self.sample_rate,
-            blocksize=self.chunk_size,
+            blocksize=self.hop_size,
+            latency="low",
             callback=self._audio_callback,
         )
         self.stream.start()
@@ -237,14 +508,44 @@ class AudioAnalyzer:
             self.stream.stop()
             self.stream.close()
             self.stream = None
+        if self._worker:
+            self._worker.join(timeout=1.0)
+            self._worker = None
 
     def get_latest(self) -> AudioFeatures:
-        """Get most recent audio features."""
-        return self.latest_features
+        """Get a consistent snapshot of the most recent audio features."""
+        while True:
+            f = self.latest_features
+            seq = f.seq
+            if seq < 0:
+                continue  # caught the slot mid-rewrite; a newer one is coming
+            snapshot = AudioFeatures(
+                f.bass, f.mid, f.treble, f.rms, f.beat_detected,
+                f.onset_strength, f.bpm, f.beat_phase, f.is_silent, seq,
+                f.beat_count, f.beat_strength,
+            )
+            if f.seq == seq:
+                return snapshot
+
+    def wait_for_features(self, timeout: Optional[float] = None) -> bool:
+        """Block until a frame newer than the last wait is published.
+
+        Returns False if no new frame arrived within the timeout.
+        """
+        if not self._new_features.wait(timeout):
+            return False
+        self._new_features.clear()
+        return True
 
     def update_sensitivity(self, sensitivity: float):
         """Update beat detection sensitivity."""
         self.sensitivity = max(0.2, min(1.0, sensitivity))
+        self._apply_sensitivity()
+
+    def _apply_sensitivity(self):
+        """Derive the onset constants, which only change with sensitivity."""
+        self._onset_threshold = 1.1 + (1.0 - self.sensitivity) * 0.5  # Higher sensitivity = lower threshold
+        self._min_interval = 0.2 + (1.0 - self.sensitivity) * 0.2
 
 
 def list_audio_devices():
@@ -262,33 +563,62 @@ def list_audio_devices():
 # Movement System
 # =============================================================================
 
+# Beat emphasis per GenrePreset.emphasis_style, as (head pitch gain, head roll
+# gain) in degrees per unit strength; resolved once when the preset is set
+_EMPHASIS_GAINS = {
+    "headbang": (-35.0, 0.0),
+    "nod": (-25.0, 0.0),
+    "tilt": (0.0, 30.0),
+}
+
+
+# Safety limits for the smoothed DoFs (head_z mm, head_roll deg, body_yaw rad,
+# antennas), in DanceController's vector order
+_POSE_LIMITS_HI = np.array([20.0, 45.0, 55.0 * DEG2RAD, 1.0, 1.0])
+_POSE_LIMITS_LO = -_POSE_LIMITS_HI
+
+
 class DanceController:
     """Maps audio to robot movements with genre-specific styles."""
 
     def __init__(self, preset: GenrePreset, intensity: float = 0.7):
-        self.preset = preset
+        self.update_preset(preset)
         self.intensity = intensity
         self.dance_time = 0.0
+        self._beats_seen = 0  # features.beat_count at the previous frame
 
-        # Smoothing state
-        self.smooth_head_z = 0.0
-        self.smooth_head_roll = 0.0
-        self.smooth_body_yaw = 0.0
-        self.smooth_antenna_l = 0.0
-        self.smooth_antenna_r = 0.0
+        # Per-DoF vectors, all in the order head_z, head_roll, body_yaw,
+        # antenna_l, antenna_r: each frame is one np.sin over the phase
+        # multipliers, one scale by the amplitudes, one fused smoothing update
+        self._smooth = np.zeros(5)
+        self._target = np.empty(5)
+        self._amp = np.empty(5)
+        self._pose = np.empty(5)
 
     def update_preset(self, preset: GenrePreset):
         """Change the active genre preset."""
         self.preset = preset
+        self._emphasis = _EMPHASIS_GAINS.get(preset.emphasis_style, (0.0, 0.0))
+        # Scalars read every frame, copied off the (immutable) preset once
+        self._head_amp = preset.head_bob_amplitude
+        self._body_amp = preset.body_sway_amplitude * DEG2RAD  # yaw is sent in radians
+        self._antenna_amp = preset.antenna_amplitude
+        self._smoothing = preset.movement_smoothing
+        self._phase_mult = np.array([preset.head_bob_speed, 0.5, preset.body_sway_speed, 2.0, 2.0])
+        self._phase_offset = np.array([0.0, 0.0, 0.0, 0.0, math.pi])
 
     def update_intensity(self, intensity: float):
         """Update movement intensity."""
         self.intensity = max(0.1, min(1.0, intensity))
 
     def get_movement(self, features: AudioFeatures):
-        """Calculate movement based on audio features and genre preset."""
+        """Calculate movement based on audio features and genre preset.
+
+        Head z is in mm, head roll/pitch in degrees, body yaw in radians
+        (ready for goto_target) and antennas in their native units.
+        """
         self.dance_time += 0.1  # For tilt alternation, matches loop rate
-        preset = self.preset
+        head_amp = self._head_amp
 
         # Use beat_phase (0-1) synced to actual detected beats, convert to radians
         phase = features.beat_phase * 2 * math.pi
@@ -297,50 +627,159 @@ class DanceController:
         base_energy = 0.8 + 0.2 * features.rms  # Always at least 80% movement
         energy = base_energy * self.intensity
 
-        # BODY SWAY - huge sweeping motion
-        bass_boost = 0.8 + 0.5 * features.bass
-        body_target = preset.body_sway_amplitude * energy * bass_boost * math.sin(phase * preset.body_sway_speed)
-
+        amp = self._amp
         # HEAD MOVEMENT - big dramatic bobbing and rolling
         mid_boost = 0.7 + 0.6 * features.mid
-        head_z_target = preset.head_bob_amplitude * energy * 1.2 * math.sin(phase * preset.head_bob_speed)
-        head_roll_target = preset.head_bob_amplitude * 2.0 * energy * mid_boost * math.sin(phase * 0.5)
-
-        # Beat-triggered emphasis - really punch those beats
-        head_pitch = 0
-        if features.beat_detected:
-            strength = max(features.onset_strength, 1.2) * self.intensity
-            if preset.emphasis_style == "headbang":
-                head_pitch = -35 * strength
-            elif preset.emphasis_style == "nod":
-                head_pitch = -25 * strength
-            elif preset.emphasis_style == "tilt":
-                head_roll_target += 30 * strength * (1 if self.dance_time % 2 > 1 else -1)
-
-        # ANTENNAS - super bouncy and expressive
+        amp[0] = head_amp * energy * 1.2
+        amp[1] = head_amp * 2.0 * energy * mid_boost
+        # BODY SWAY - huge sweeping motion
+        bass_boost = 0.8 + 0.5 * features.bass
+        amp[2] = self._body_amp * energy * bass_boost
+        # ANTENNAS - super bouncy and expressive, in anti-phase
         treble_boost = 0.6 + 0.6 * features.treble
-        ant_amp = preset.antenna_amplitude * energy * treble_boost * 2.0
-        antenna_l_target = ant_amp * math.sin(phase * 2)
-        antenna_r_target = ant_amp * math.sin(phase * 2 + math.pi)
+        amp[3] = amp[4] = self._antenna_amp * energy * treble_boost * 2.0
+
+        target = np.multiply(self._phase_mult, phase, out=self._target)
+        target += self._phase_offset
+        np.sin(target, out=target)
+        target *= amp
+
+        # Beat-triggered emphasis - really punch those beats. Any beat since
+        # the last frame counts, not just one landing on this exact hop
+        head_pitch = 0.0
+        new_beat = features.beat_count != self._beats_seen
+        self._beats_seen = features.beat_count
+        if new_beat:
+            strength = max(features.beat_strength, 1.2) * self.intensity
+            pitch_gain, roll_gain = self._emphasis
+            head_pitch = pitch_gain * strength
+            if roll_gain:
+                target[1] += roll_gain * strength * (1 if self.dance_time % 2 > 1 else -1)
 
         # Smoothing - apply to all movements for fluid motion
-        smooth = preset.movement_smoothing
-        self.smooth_head_z = smooth * self.smooth_head_z + (1 - smooth) * head_z_target
-        self.smooth_head_roll = smooth * self.smooth_head_roll + (1 - smooth) * head_roll_target
-        self.smooth_body_yaw = smooth * self.smooth_body_yaw + (1 - smooth) * body_target
-        self.smooth_antenna_l = smooth * self.smooth_antenna_l + (1 - smooth) * antenna_l_target
-        self.smooth_antenna_r = smooth * self.smooth_antenna_r + (1 - smooth) * antenna_r_target
+        smooth = self._smoothing
+        state = self._smooth
+        state *= smooth
+        state += np.multiply(target, 1 - smooth, out=target)
+        # Safety limits, clipped in one pass into the output buffer
+        pose = np.clip(state, _POSE_LIMITS_LO, _POSE_LIMITS_HI, out=self._pose)
+        head_z, head_roll, body_yaw, antenna_l, antenna_r = pose.tolist()
 
         return {
-            'head_z': max(-20, min(20, self.smooth_head_z)),
-            'head_roll': max(-45, min(45, self.smooth_head_roll)),
-            'head_pitch': max(-45, min(45, head_pitch)),
-            'body_yaw': max(-55, min(55, self.smooth_body_yaw)),
-            'antenna_left': max(-1.0, min(1.0, self.smooth_antenna_l)),
-            'antenna_right': max(-1.0, min(1.0, self.smooth_antenna_r)),
+            'head_z': head_z,
+            'head_roll': head_roll,
+            'head_pitch': max(-45.0, min(45.0, head_pitch)),
+            'body_yaw': body_yaw,
+            'antenna_left': antenna_l,
+            'antenna_right': antenna_r,
         }
 
 
+def movement_changed(movement: dict, last: Optional[dict]) -> bool:
+    """True if any commanded DoF moved further than its deadband since last."""
+    if last is None:
+        return True
+    return any(abs(movement[k] - last[k]) > eps for k, eps in COMMAND_DEADBAND.items())
+
+
+def head_pose(z_mm: float, roll_deg: float) -> np.ndarray:
+    """4x4 head pose with only z and roll set.
+
+    Same matrix as create_head_pose(z=z_mm, roll=roll_deg, mm=True,
+    degrees=True), minus the general xyz-euler path - the dance only ever
+    moves these two DoF.
+    """
+    roll = math.radians(roll_deg)
+    c, s = math.cos(roll), math.sin(roll)
+    pose = np.eye(4)
+    pose[1, 1] = c
+    pose[1, 2] = -s
+    pose[2, 1] = s
+    pose[2, 2] = c
+    pose[2, 3] = z_mm * 0.001
+    return pose
+
+
+# =============================================================================
+# Status Display
+# =============================================================================
+
+# Rendered on every status refresh, so the markup is a module constant and
+# each refresh is a single str.format over the dynamic values
+STATUS_TEMPLATE = """
+<div style="padding: 15px;">
+    <div style="text-align: center; margin-bottom: 15px;">
+        <div style="font-size: 18px; font-weight: bold; color: {status_color};">
+            {status}{beat_indicator}
+        </div>
+        <div style="font-size: 12px; color: #888; margin-top: 4px;">{genre_name}</div>
+    </div>
+
+    <div style="text-align: center; margin-bottom: 20px;">
+        <div style="font-size: 48px; font-family: monospace; font-weight: bold;">
+            {bpm}
+        </div>
+        <div style="font-size: 14px; color: #666;">BPM</div>
+    </div>
+
+    <div style="background: #f5f5f5; padding: 15px; border-radius: 10px;">
+        <div style="margin-bottom: 12px;">
+            <div style="font-size: 12px; color: #666; margin-bottom: 4px;">Bass</div>
+            <div style="background: #e0e0e0; border-radius: 4px; overflow: hidden;">
+                <div style="width: {bass_width}%; height: 12px; background: #e91e63; transition: width 0.1s;"></div>
+            </div>
+        </div>
+        <div style="margin-bottom: 12px;">
+            <div style="font-size: 12px; color: #666; margin-bottom: 4px;">Mid</div>
+            <div style="background: #e0e0e0; border-radius: 4px; overflow: hidden;">
+                <div style="width: {mid_width}%; height: 12px; background: #9c27b0; transition: width 0.1s;"></div>
+            </div>
+        </div>
+        <div style="margin-bottom: 12px;">
+            <div style="font-size: 12px; color: #666; margin-bottom: 4px;">Treble</div>
+            <div style="background: #e0e0e0; border-radius: 4px; overflow: hidden;">
+                <div style="width: {treble_width}%; height: 12px; background: #3f51b5; transition: width 0.1s;"></div>
+            </div>
+        </div>
+        <div>
+            <div style="font-size: 12px; color: #666; margin-bottom: 4px;">Energy</div>
+            <div style="background: #e0e0e0; border-radius: 4px; overflow: hidden;">
+                <div style="width: {rms_width}%; height: 12px; background: #4CAF50; transition: width 0.1s;"></div>
+            </div>
+        </div>
+    </div>
+</div>
+"""
+
+
+def status_values(features: AudioFeatures, is_vibing: bool, genre_name: str,
+                  beats_seen: Optional[int] = None) -> dict:
+    """Everything the status panel shows, at display precision.
+
+    The beat indicator lights when beat_count moved past beats_seen (the
+    count at the caller's previous read). Two frames with equal values
+    render identical HTML.
+    """
+    beat = beats_seen is not None and features.beat_count != beats_seen
+    return {
+        'status': "Vibing!" if is_vibing else "Ready",
+        'status_color': "#4CAF50" if is_vibing else "#666",
+        'beat_indicator': " *" if beat and is_vibing else "",
+        'beat_count': features.beat_count,
+        'genre_name': genre_name,
+        'bpm': round(features.bpm),
+        'bass_width': int(features.bass * 100),
+        'mid_width': int(features.mid * 100),
+        'treble_width': int(features.treble * 100),
+        'rms_width': int(features.rms * 100),
+    }
+
+
+def render_status(values: dict) -> str:
+    """Render the status panel HTML from status_values()."""
+    return STATUS_TEMPLATE.format_map(values)
+
+
 # =============================================================================
 # ReachyMiniApp
 # =============================================================================
@@ -358,9 +797,11 @@ class ReachyMiniDjReactor(ReachyMiniApp):
         self.controller: Optional[DanceController] = None
         self.is_vibing = False
         self.current_genre = "electronic"
+        self._current_preset = GENRE_PRESETS[self.current_genre]
         self.intensity = 0.7
         self.sensitivity = 0.6
         self.latest_features = AudioFeatures()
+        self._vibing_started = threading.Event()  # wakes the idle dance loop
 
     def run(self, reachy_mini: ReachyMini, stop_event: threading.Event):
         """Main loop - called by dashboard."""
@@ -374,31 +815,45 @@ class ReachyMiniDjReactor(ReachyMiniApp):
         ui_thread.start()
 
         # Main dance loop
+        last_movement = None
+        last_frame = None  # (analyzer, seq) of the frame last danced to
         while not stop_event.is_set():
-            if self.is_vibing and self.analyzer and self.controller:
-                features = self.analyzer.get_latest()
-                self.latest_features = features
-
-                if not features.is_silent:
-                    movement = self.controller.get_movement(features)
+            analyzer = self.analyzer
+            if not (self.is_vibing and analyzer and self.controller):
+                # Idle: sleep until Start is pressed (the timeout bounds how
+                # long shutdown can take to be noticed)
+                if self._vibing_started.wait(timeout=1.0):
+                    self._vibing_started.clear()
+                continue
+
+            # Only move on fresh audio - a stalled stream sends nothing
+            if not analyzer.wait_for_features(timeout=0.5):
+                continue
+            features = analyzer.get_latest()
+            self.latest_features = features
+            frame = (analyzer, features.seq)
+            if frame == last_frame:
+                continue  # duplicate wake-up, nothing new to map
+            last_frame = frame
+
+            if not features.is_silent:
+                movement = self.controller.get_movement(features)
+                # Sustained passages settle into near-identical poses;
+                # don't spend robot I/O re-sending them
+                if movement_changed(movement, last_movement):
+                    last_movement = movement
                     try:
-                        head_pose = create_head_pose(
-                            z=movement['head_z'],
-                            roll=movement['head_roll'],
-                            mm=True,
-                            degrees=True
-                        )
                         reachy_mini.goto_target(
-                            head=head_pose,
+                            head=head_pose(movement['head_z'], movement['head_roll']),
                             antennas=[movement['antenna_left'], movement['antenna_right']],
-                            body_yaw=np.deg2rad(movement['body_yaw']),
+                            body_yaw=movement['body_yaw'],
                             duration=0.12,
                             method="minjerk"
                         )
                     except Exception as e:
                         logger.debug(f"Movement error: {e}")
 
-            time.sleep(0.1)  # 10fps - let movements complete before next command
+            stop_event.wait(0.1)  # 10fps - let movements complete before next command
 
         # Cleanup
         if self.analyzer:
@@ -408,28 +863,28 @@ class ReachyMiniDjReactor(ReachyMiniApp):
         """Run Gradio UI with genre selection and visualizers."""
         devices = list_audio_devices()
         device_names = [d['name'] for d in devices]
+        # Duplicate names resolve to the first device, as a list scan would
+        device_index_by_name = {}
+        for d in devices:
+            device_index_by_name.setdefault(d['name'], d['index'])
         genre_choices = [(p.display_name, name) for name, p in GENRE_PRESETS.items()]
 
         def start_vibing(device_name, genre, intensity, sensitivity):
             if self.is_vibing:
                 return get_status()
 
-            # Find device index
-            device_idx = None
-            for d in devices:
-                if d['name'] == device_name:
-                    device_idx = d['index']
-                    break
+            device_idx = device_index_by_name.get(device_name)
 
             self.current_genre = genre
+            self._current_preset = GENRE_PRESETS.get(genre, GENRE_PRESETS["electronic"])
             self.intensity = intensity
             self.sensitivity = sensitivity
 
-            preset = GENRE_PRESETS.get(genre, GENRE_PRESETS["electronic"])
-            self.controller = DanceController(preset, intensity)
+            self.controller = DanceController(self._current_preset, intensity)
             self.analyzer = AudioAnalyzer(device_index=device_idx, sensitivity=sensitivity)
             self.analyzer.start()
             self.is_vibing = True
+            self._vibing_started.set()
             return get_status()
 
         def stop_vibing():
@@ -441,9 +896,9 @@ class ReachyMiniDjReactor(ReachyMiniApp):
 
         def change_genre(genre):
             self.current_genre = genre
+            self._current_preset = GENRE_PRESETS.get(genre, GENRE_PRESETS["electronic"])
             if self.controller:
-                preset = GENRE_PRESETS.get(genre, GENRE_PRESETS["electronic"])
-                self.controller.update_preset(preset)
+                self.controller.update_preset(self._current_preset)
             return get_status()
 
         def update_intensity(intensity):
@@ -456,56 +911,19 @@ class ReachyMiniDjReactor(ReachyMiniApp):
             if self.analyzer:
                 self.analyzer.update_sensitivity(sensitivity)
 
-        def bar(value, color):
-            """Generate a colored bar HTML."""
-            width = int(value * 100)
-            return f'''<div style="background: #e0e0e0; border-radius: 4px; overflow: hidden;">
-                <div style="width: {width}%; height: 12px; background: {color}; transition: width 0.1s;"></div>
-            </div>'''
+        def current_status(beats_seen=None):
+            return status_values(self.latest_features, self.is_vibing,
+                                 self._current_preset.display_name, beats_seen)
 
         def get_status():
-            f = self.latest_features
-            status = "Vibing!" if self.is_vibing else "Ready"
-            status_color = "#4CAF50" if self.is_vibing else "#666"
-            beat_indicator = " *" if f.beat_detected and self.is_vibing else ""
-            genre_name = GENRE_PRESETS.get(self.current_genre, GENRE_PRESETS["electronic"]).display_name
-
-            return f"""
-            <div style="padding: 15px;">
-                <div style="text-align: center; margin-bottom: 15px;">
-                    <div style="font-size: 18px; font-weight: bold; color: {status_color};">
-                        {status}{beat_indicator}
-                    </div>
-                    <div style="font-size: 12px; color: #888; margin-top: 4px;">{genre_name}</div>
-                </div>
-
-                <div style="text-align: center; margin-bottom: 20px;">
-                    <div style="font-size: 48px; font-family: monospace; font-weight: bold;">
-                        {f.bpm:.0f}
-                    </div>
-                    <div style="font-size: 14px; color: #666;">BPM</div>
-                </div>
-
-                <div style="background: #f5f5f5; padding: 15px; border-radius: 10px;">
-                    <div style="margin-bottom: 12px;">
-                        <div style="font-size: 12px; color: #666; margin-bottom: 4px;">Bass</div>
-                        {bar(f.bass, '#e91e63')}
-                    </div>
-                    <div style="margin-bottom: 12px;">
-                        <div style="font-size: 12px; color: #666; margin-bottom: 4px;">Mid</div>
-                        {bar(f.mid, '#9c27b0')}
-                    </div>
-                    <div style="margin-bottom: 12px;">
-                        <div style="font-size: 12px; color: #666; margin-bottom: 4px;">Treble</div>
-                        {bar(f.treble, '#3f51b5')}
-                    </div>
-                    <div>
-                        <div style="font-size: 12px; color: #666; margin-bottom: 4px;">Energy</div>
-                        {bar(f.rms, '#4CAF50')}
-                    </div>
-                </div>
-            </div>
-            """
+            return render_status(current_status())
+
+        def refresh_status(shown):
+            """Timer tick: only re-send the panel when something visible changed."""
+            values = current_status(shown['beat_count'] if shown else None)
+            if values == shown:
+                return gr.update(), shown
+            return render_status(values), values
 
         with gr.Blocks(title="DJ Reactor", theme=gr.themes.Soft()) as demo:
             gr.HTML("""
@@ -551,10 +969,11 @@ class ReachyMiniDjReactor(ReachyMiniApp):
 
                 with gr.Column(scale=1):
                     status_html = gr.HTML(value=get_status())
+                    shown_status = gr.State(None)  # per-session: values last sent to this browser
 
             # Auto-refresh status
             timer = gr.Timer(value=0.3)
-            timer.tick(fn=get_status, outputs=[status_html])
+            timer.tick(fn=refresh_status, inputs=[shown_status], outputs=[status_html, shown_status])
 
             # Event handlers
             start_btn.click(
@@ -7,6 +7,13 @@ Memory-first, proactive, multi-backend companion for Reachy Mini.
 __version__ = "0.1.0"
 __author__ = "Justin Johnson"
 
-from .main import ReachyMiniEcho
-
 __all__ = ["ReachyMiniEcho"]
+
+
+def __getattr__(name):
+    # Import the app (gradio, reachy_mini, providers) on first use, so
+    # `python -m echo` can print its usage banner without loading them
+    if name == "ReachyMiniEcho":
+        from .main import ReachyMiniEcho
+        return ReachyMiniEcho
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,8 +3,6 @@
 import sys
 import logging
 
-from .main import ReachyMiniEcho, DEFAULT_LITELLM_URL, DEFAULT_MODEL
-
 
 def main():
     """Main entry point."""
@@ -18,6 +16,8 @@ def main():
     if sim_mode:
         from threading import Event
 
+        from .main import ReachyMiniEcho, DEFAULT_LITELLM_URL, DEFAULT_MODEL
+
         print("=" * 50)
         print("  Reachy Echo - Simulation Mode")
         print("=" * 50)
@@ -26,33 +26,11 @@ def main():
         print(f"  Model:   {DEFAULT_MODEL}")
         print()
 
-        # Create mock stop event
-        stop_event = Event()
-
-        # Initialize Echo
-        echo = ReachyMiniEcho()
-        echo.reachy = None
-        echo.stop_event = stop_event
-
-        # Initialize systems
-        echo._init_systems()
-
-        # Build and launch UI
-        app = echo._build_ui()
-
         print("Starting Gradio UI...")
         print("Open http://localhost:7861 in your browser")
         print()
 
-        try:
-            app.launch(
-                server_name="0.0.0.0",
-                server_port=7861,
-                show_error=True,
-            )
-        except KeyboardInterrupt:
-            print("\nShutting down...")
-            echo._cleanup()
+        ReachyMiniEcho().run_simulation(Event(), port=7861)
     else:
         print()
         print("Reachy Echo")
@@ -7,10 +7,15 @@ A companion robot that remembers you and grows with you.
 import asyncio
 import logging
 import os
+import queue
 import random
+import re
 import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from threading import Event, Thread
+from threading import Event, Lock, Thread
 from typing import Optional, List
 
 import gradio as gr
@@ -21,7 +26,7 @@ from reachy_mini.utils import create_head_pose
 from .providers import LiteLLMProvider, LiteLLMConfig
 from .memory import MemoryManager
 from .proactive import ProactiveEngine
-from .voice import VoiceManager, process_voice_input, generate_voice_response
+from .voice import VoiceManager, process_voice_input, generate_voice_response, save_audio
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +38,142 @@ DEFAULT_MODEL = os.getenv("LITELLM_MODEL", "google/gemini-2.5-flash-lite")
 # Available models (populated from LiteLLM)
 AVAILABLE_MODELS: List[str] = []
 
+# Where a streamed reply is cut into clips for TTS
+SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+BASE_SYSTEM_PROMPT = """You are Echo, a friendly robot companion on the user's desk.
+
+You are warm, helpful, and genuinely interested in the user. You remember past conversations and build a real relationship over time.
+
+Key traits:
+- Friendly but not saccharine
+- Genuinely curious about the user
+- Remember and reference past conversations naturally
+- Notice patterns (work habits, preferences)
+- Celebrate wins, offer support during frustrations
+- Keep responses concise (you're a companion, not a lecturer)
+
+IMPORTANT: Never describe your physical movements, gestures, or body language in your responses. Don't write things like "*waves antenna*" or "My head turns toward you". Just speak naturally - your physical body handles movement separately.
+"""
+
+
+# Static page styles, passed to gr.Blocks once rather than inlined in the header
+ECHO_CSS = """
+.echo-header {
+    text-align: center;
+    padding: 1.5rem 0 1rem;
+    border-bottom: 1px solid #e5e7eb;
+    margin-bottom: 1.5rem;
+}
+.echo-header h1 {
+    font-size: 2rem;
+    font-weight: 700;
+    color: #4f46e5;
+    margin: 0;
+}
+.echo-header p {
+    color: #6b7280;
+    margin-top: 0.5rem;
+    font-size: 1rem;
+}
+.status-badge {
+    display: inline-flex;
+    align-items: center;
+    gap: 0.5rem;
+    padding: 0.4rem 0.8rem;
+    border: 1px solid;
+    border-radius: 16px;
+    font-size: 0.8rem;
+    margin-top: 0.75rem;
+    font-weight: 500;
+}
+.status-badge.connected {
+    background: #dcfce7;
+    border-color: #86efac;
+    color: #166534;
+}
+.status-badge.disconnected {
+    background: #fef3c7;
+    border-color: #fcd34d;
+    color: #92400e;
+}
+.status-badge.voice {
+    background: #dbeafe;
+    border-color: #93c5fd;
+    color: #1e40af;
+}
+.memory-grid {
+    display: grid;
+    grid-template-columns: repeat(3, 1fr);
+    gap: 0.5rem;
+    margin-top: 0.5rem;
+}
+.memory-stat {
+    text-align: center;
+    padding: 0.75rem 0.5rem;
+    background: #f8fafc;
+    border-radius: 8px;
+    border: 1px solid #e2e8f0;
+}
+.memory-stat .value {
+    font-size: 1.25rem;
+    font-weight: 700;
+    color: #4f46e5;
+}
+.memory-stat .label {
+    font-size: 0.7rem;
+    color: #64748b;
+    margin-top: 0.2rem;
+    text-transform: uppercase;
+    letter-spacing: 0.05em;
+}
+.panel-title {
+    font-size: 0.75rem;
+    font-weight: 600;
+    color: #64748b;
+    text-transform: uppercase;
+    letter-spacing: 0.05em;
+    margin-bottom: 0.5rem;
+}
+footer { display: none !important; }
+"""
+
+HEADER_TEMPLATE = """
+<div class="echo-header">
+    <h1>Reachy Echo</h1>
+    <p>A companion that remembers you and grows with you</p>
+    {status}
+    {voice}
+</div>
+"""
+STATUS_BADGE_OK = '<div class="status-badge connected"><span>●</span><span>Connected</span></div>'
+STATUS_BADGE_OFF = '<div class="status-badge disconnected"><span>○</span><span>Disconnected</span></div>'
+VOICE_BADGE = '<div class="status-badge voice"><span>🎤</span><span>Voice: {backend}</span></div>'
+
+
+STATS_TEMPLATE = """
+<div class="memory-grid">
+    <div class="memory-stat">
+        <div class="value">{facts}</div>
+        <div class="label">Facts</div>
+    </div>
+    <div class="memory-stat">
+        <div class="value">{sessions}</div>
+        <div class="label">Sessions</div>
+    </div>
+    <div class="memory-stat">
+        <div class="value">{messages}</div>
+        <div class="label">Messages</div>
+    </div>
+</div>
+"""
+
+
+@lru_cache(maxsize=1)
+def render_stats_html(facts: int, sessions: int, messages: int) -> str:
+    """Memory stats panel for the sidebar."""
+    return STATS_TEMPLATE.format(facts=facts, sessions=sessions, messages=messages)
+
 
 class ReachyMiniEcho(ReachyMiniApp):
     """
@@ -64,6 +205,11 @@ class ReachyMiniEcho(ReachyMiniApp):
         self.provider: Optional[LiteLLMProvider] = None
         self.proactive: Optional[ProactiveEngine] = None
         self.voice: Optional[VoiceManager] = None
+        self._tts_pool: Optional[ThreadPoolExecutor] = None
+
+        # Robot gestures, played one at a time by a single motion thread
+        self._motion_queue: queue.Queue = queue.Queue(maxsize=2)
+        self._motion_thread: Optional[Thread] = None
 
         # State
         self.user_name: Optional[str] = None
@@ -72,14 +218,16 @@ class ReachyMiniEcho(ReachyMiniApp):
         self._available_models: List[str] = []
         self._voice_enabled = False
         self._voice_backend: Optional[str] = None
+        self._system_prompt: str = ""
+        self._prompt_memory_version: Optional[int] = None  # memory.version the prompt was built from
 
         # Gradio app reference
         self._gradio_app = None
-        self._ui_thread = None
-        self._event_loop = None
+        self._connect_lock = asyncio.Lock()  # serializes provider connects from page loads
 
-        # Proactive behavior messages queue
+        # Proactive behavior messages queue (filled from the proactive engine's thread)
         self._proactive_messages: List[str] = []
+        self._proactive_lock = Lock()
 
     def run(self, reachy_mini, stop_event: Event) -> None:
         """
@@ -108,6 +256,15 @@ class ReachyMiniEcho(ReachyMiniApp):
         """Initialize memory, provider, and proactive engine."""
         logger.info("Initializing Echo systems...")
 
+        # Voice system (local DGX or OpenAI cloud). TTS calls block on
+        # HTTP/subprocess; keep them off Gradio's event loop, and bounded so a
+        # long reply can't flood the TTS backend
+        self.voice = VoiceManager()
+        self._tts_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="tts")
+        # Probing the backend can take a network round-trip; overlap it with
+        # the local setup below
+        voice_connecting = self._tts_pool.submit(self.voice.connect)
+
         # Memory system
         self.memory = MemoryManager(self.data_path)
         self.memory.start_session()
@@ -133,9 +290,7 @@ class ReachyMiniEcho(ReachyMiniApp):
         self.proactive.register_defaults()
         self.proactive.on_behavior_fired(self._on_proactive_behavior)
 
-        # Voice system (local DGX or OpenAI cloud)
-        self.voice = VoiceManager()
-        if self.voice.connect():
+        if voice_connecting.result():
             self._voice_enabled = True
             self._voice_backend = self.voice.backend_name
             logger.info(f"Voice enabled ({self._voice_backend})")
@@ -143,36 +298,64 @@ class ReachyMiniEcho(ReachyMiniApp):
             self._voice_backend = None
             logger.info("Voice disabled - no backend available")
 
+        self._motion_thread = Thread(target=self._motion_worker, daemon=True)
+        self._motion_thread.start()
+
         logger.info("Echo systems initialized")
 
+    def _motion_worker(self) -> None:
+        """Play queued gestures in order, so they never overlap on the robot."""
+        while True:
+            job = self._motion_queue.get()
+            if job is None:
+                return
+            func, args = job
+            func(*args)
+
+    def queue_motion(self, func, *args) -> None:
+        """Queue a gesture without blocking; dropped if two are already waiting."""
+        try:
+            self._motion_queue.put_nowait((func, args))
+        except queue.Full:
+            logger.debug("Motion queue full, skipping gesture")
+
     def _on_proactive_behavior(self, name: str, result) -> None:
         """Handle proactive behavior firing."""
         if result.message:
-            self._proactive_messages.append(result.message)
+            with self._proactive_lock:
+                self._proactive_messages.append(result.message)
             logger.info(f"Proactive behavior '{name}': {result.message}")
 
-    def _update_system_prompt(self) -> None:
-        """Update provider system prompt with memory context."""
-        base_prompt = """You are Echo, a friendly robot companion on the user's desk.
-
-You are warm, helpful, and genuinely interested in the user. You remember past conversations and build a real relationship over time.
+    def _update_system_prompt(self) -> bool:
+        """
+        Rebuild the system prompt from memory context if memory changed.
 
-Key traits:
-- Friendly but not saccharine
-- Genuinely curious about the user
-- Remember and reference past conversations naturally
-- Notice patterns (work habits, preferences)
-- Celebrate wins, offer support during frustrations
-- Keep responses concise (you're a companion, not a lecturer)
+        Returns True if the prompt text changed and needs pushing to the provider.
+        """
+        version = self.memory.version if self.memory else None
+        if version is not None and version == self._prompt_memory_version:
+            return False
+        self._prompt_memory_version = version
 
-IMPORTANT: Never describe your physical movements, gestures, or body language in your responses. Don't write things like "*waves antenna*" or "My head turns toward you". Just speak naturally - your physical body handles movement separately.
-"""
-        # Add memory context
         memory_context = self.memory.build_context() if self.memory else ""
-        if memory_context:
-            base_prompt += f"\n\n{memory_context}"
+        prompt = f"{BASE_SYSTEM_PROMPT}\n\n{memory_context}" if memory_context else BASE_SYSTEM_PROMPT
+        if prompt == self._system_prompt:
+            return False
+        self._system_prompt = prompt
+        return True
+
+    async def _save_turn(self, messages: list) -> None:
+        """Write a chat turn to memory in one transaction, then refresh the prompt."""
+        if self.memory:
+            # Facts are extracted from the user message here, so this
+            # has to land before the prompt is rebuilt
+            await asyncio.to_thread(self.memory.add_messages, messages)
+        await self._refresh_system_prompt()
 
-        self._system_prompt = base_prompt
+    async def _refresh_system_prompt(self) -> None:
+        """Push the system prompt to the provider if memory changed it."""
+        if self._update_system_prompt():
+            await self.provider.set_system_prompt(self._system_prompt)
 
     def _cleanup(self) -> None:
         """Clean up resources."""
@@ -182,55 +365,91 @@ IMPORTANT: Never describe your physical movements, gestures, or body language in
         if self.memory:
             self.memory.end_session()
 
+        if self._gradio_app:
+            self._gradio_app.close()
+
+        if self._motion_thread:
+            # Drop pending gestures and let the current one finish
+            while True:
+                try:
+                    self._motion_queue.get_nowait()
+                except queue.Empty:
+                    break
+            try:
+                # A racing chat handler can refill the queue after the drain
+                self._motion_queue.put(None, timeout=1.0)
+            except queue.Full:
+                logger.warning("Motion queue still full, not waiting for the motion thread")
+            else:
+                self._motion_thread.join(timeout=2.0)
+
+        if self._tts_pool:
+            self._tts_pool.shutdown(wait=False, cancel_futures=True)
+
         if self.provider:
             # Provider cleanup would be async, handle separately
             pass
 
-    def _start_ui(self) -> None:
-        """Start Gradio UI in background thread."""
-        self._gradio_app = self._build_ui()
-
-        def run_gradio():
-            self._gradio_app.launch(
-                server_name="0.0.0.0",
-                server_port=7863,
-                share=False,
-                prevent_thread_lock=True,
-                show_error=True,
-            )
-
-        self._ui_thread = Thread(target=run_gradio, daemon=True)
-        self._ui_thread.start()
-        logger.info("Gradio UI started on http://localhost:7863")
+    def run_simulation(self, stop_event: Event, port: int = 7861) -> None:
+        """
+        Run Echo without a robot (python -m echo --sim).
 
-    def _build_ui(self) -> gr.Blocks:
-        """Build a polished Gradio interface."""
+        Same memory, provider and UI as run(), minus movement and the
+        proactive engine. Blocks until stop_event is set or Ctrl+C.
+        """
+        self.reachy = None
+        self.stop_event = stop_event
 
-        # Create event loop for async operations
-        self._event_loop = asyncio.new_event_loop()
+        self._init_systems()
+        self._start_ui(port)
 
-        def run_async(coro):
-            """Run async coroutine in the event loop."""
-            return asyncio.run_coroutine_threadsafe(coro, self._event_loop).result(timeout=60)
+        try:
+            stop_event.wait()
+        except KeyboardInterrupt:
+            logger.info("Shutting down...")
+        finally:
+            self._cleanup()
+
+    def _start_ui(self, port: int = 7863) -> None:
+        """Start Gradio UI (its server runs in Gradio's own background thread)."""
+        self._gradio_app = self._build_ui()
+        self._gradio_app.launch(
+            server_name="0.0.0.0",
+            server_port=port,
+            share=False,
+            prevent_thread_lock=True,
+            show_error=True,
+        )
+        logger.info(f"Gradio UI started on http://localhost:{port}")
 
-        # Start event loop in background thread
-        def start_loop():
-            asyncio.set_event_loop(self._event_loop)
-            self._event_loop.run_forever()
+    async def _ensure_connected(self) -> None:
+        """
+        Connect the provider and fetch available models, once.
 
-        Thread(target=start_loop, daemon=True).start()
+        Runs on Gradio's event loop (from the page-load handler) so the
+        provider's HTTP client lives on the same loop as the chat handlers.
+        """
+        async with self._connect_lock:
+            if self._is_connected:
+                return
+            try:
+                await self.provider.connect()
+                await self.provider.set_system_prompt(self._system_prompt)
+                self._is_connected = True
+                self._available_models = await self.provider.get_available_models()
+                logger.info(f"Provider connected. {len(self._available_models)} models available.")
+            except Exception as e:
+                logger.warning(f"Provider not available (will retry on next page load): {e}")
+                self._available_models = [DEFAULT_MODEL]
+
+    def _header_html(self) -> str:
+        """Header with connection and voice status badges."""
+        status = STATUS_BADGE_OK if self._is_connected else STATUS_BADGE_OFF
+        voice = VOICE_BADGE.format(backend=self._voice_backend) if self._voice_enabled else ""
+        return HEADER_TEMPLATE.format(status=status, voice=voice)
 
-        # Connect provider and get available models (with fast timeout)
-        try:
-            run_async(self.provider.connect())
-            run_async(self.provider.set_system_prompt(self._system_prompt))
-            self._is_connected = True
-            self._available_models = run_async(self.provider.get_available_models())
-            logger.info(f"Provider connected. {len(self._available_models)} models available.")
-        except Exception as e:
-            logger.warning(f"Provider not available (will retry on use): {e}")
-            self._is_connected = False
-            self._available_models = [DEFAULT_MODEL]
+    def _build_ui(self) -> gr.Blocks:
+        """Build a polished Gradio interface."""
 
         # Get initial stats
         stats = self.memory.get_stats() if self.memory else {"facts": 0, "sessions": 0, "messages": 0}
@@ -242,85 +461,9 @@ IMPORTANT: Never describe your physical movements, gestures, or body language in
             neutral_hue=gr.themes.colors.slate,
         )
 
-        with gr.Blocks(title="Reachy Echo", theme=theme) as app:
+        with gr.Blocks(title="Reachy Echo", theme=theme, css=ECHO_CSS) as app:
             # Header
-            gr.HTML(f"""
-                <style>
-                    .echo-header {{
-                        text-align: center;
-                        padding: 1.5rem 0 1rem;
-                        border-bottom: 1px solid #e5e7eb;
-                        margin-bottom: 1.5rem;
-                    }}
-                    .echo-header h1 {{
-                        font-size: 2rem;
-                        font-weight: 700;
-                        color: #4f46e5;
-                        margin: 0;
-                    }}
-                    .echo-header p {{
-                        color: #6b7280;
-                        margin-top: 0.5rem;
-                        font-size: 1rem;
-                    }}
-                    .status-badge {{
-                        display: inline-flex;
-                        align-items: center;
-                        gap: 0.5rem;
-                        padding: 0.4rem 0.8rem;
-                        background: {'#dcfce7' if self._is_connected else '#fef3c7'};
-                        border: 1px solid {'#86efac' if self._is_connected else '#fcd34d'};
-                        border-radius: 16px;
-                        font-size: 0.8rem;
-                        color: {'#166534' if self._is_connected else '#92400e'};
-                        margin-top: 0.75rem;
-                        font-weight: 500;
-                    }}
-                    .memory-grid {{
-                        display: grid;
-                        grid-template-columns: repeat(3, 1fr);
-                        gap: 0.5rem;
-                        margin-top: 0.5rem;
-                    }}
-                    .memory-stat {{
-                        text-align: center;
-                        padding: 0.75rem 0.5rem;
-                        background: #f8fafc;
-                        border-radius: 8px;
-                        border: 1px solid #e2e8f0;
-                    }}
-                    .memory-stat .value {{
-                        font-size: 1.25rem;
-                        font-weight: 700;
-                        color: #4f46e5;
-                    }}
-                    .memory-stat .label {{
-                        font-size: 0.7rem;
-                        color: #64748b;
-                        margin-top: 0.2rem;
-                        text-transform: uppercase;
-                        letter-spacing: 0.05em;
-                    }}
-                    .panel-title {{
-                        font-size: 0.75rem;
-                        font-weight: 600;
-                        color: #64748b;
-                        text-transform: uppercase;
-                        letter-spacing: 0.05em;
-                        margin-bottom: 0.5rem;
-                    }}
-                    footer {{ display: none !important; }}
-                </style>
-                <div class="echo-header">
-                    <h1>Reachy Echo</h1>
-                    <p>A companion that remembers you and grows with you</p>
-                    <div class="status-badge">
-                        <span>{'●' if self._is_connected else '○'}</span>
-                        <span>{'Connected' if self._is_connected else 'Disconnected'}</span>
-                    </div>
-                    {f'<div class="status-badge" style="background: #dbeafe; border-color: #93c5fd; color: #1e40af;"><span>🎤</span><span>Voice: {self._voice_backend}</span></div>' if self._voice_enabled else ''}
-                </div>
-            """)
+            header_html = gr.HTML(self._header_html())
 
             with gr.Row():
                 # Main chat column
@@ -358,7 +501,7 @@ IMPORTANT: Never describe your physical movements, gestures, or body language in
                                     variant="primary",
                                 )
 
-                        with gr.Tab("Voice", visible=self._voice_enabled):
+                        with gr.Tab("Voice", visible=self._voice_enabled) as voice_tab:
                             gr.Markdown("*Click to record, release to send*")
                             audio_input = gr.Audio(
                                 sources=["microphone"],
@@ -375,22 +518,7 @@ IMPORTANT: Never describe your physical movements, gestures, or body language in
                 with gr.Column(scale=1, min_width=260):
                     # Memory Panel
                     gr.Markdown("### Memory")
-                    memory_html = gr.HTML(f"""
-                        <div class="memory-grid">
-                            <div class="memory-stat">
-                                <div class="value">{stats['facts']}</div>
-                                <div class="label">Facts</div>
-                            </div>
-                            <div class="memory-stat">
-                                <div class="value">{stats['sessions']}</div>
-                                <div class="label">Sessions</div>
-                            </div>
-                            <div class="memory-stat">
-                                <div class="value">{stats['messages']}</div>
-                                <div class="label">Messages</div>
-                            </div>
-                        </div>
-                    """)
+                    memory_html = gr.HTML(render_stats_html(stats['facts'], stats['sessions'], stats['messages']))
 
                     # LLM Settings
                     with gr.Accordion("LLM", open=True):
@@ -452,101 +580,118 @@ IMPORTANT: Never describe your physical movements, gestures, or body language in
 
             # Hidden status for updates
             status_state = gr.State(value=self._is_connected)
+            # Stats counts currently shown in this session's memory panel
+            shown_stats = gr.State(value=(stats['facts'], stats['sessions'], stats['messages']))
 
             # === Event Handlers ===
 
-            async def send_message_async(message: str, history: list) -> tuple:
-                """Process message and get response with TTS."""
+            async def send_message_async(message: str, history: list):
+                """Process message, streaming the reply and synthesizing TTS alongside it."""
                 if not message.strip():
-                    return "", history, None
+                    yield "", history, gr.update()
+                    return
 
                 history = history or []
-                response = ""
                 audio_path = None
 
-                # Check for proactive messages to inject (Gradio 6 format)
-                while self._proactive_messages:
-                    proactive_msg = self._proactive_messages.pop(0)
-                    history.append({"role": "assistant", "content": f"*{proactive_msg}*"})
+                # Inject pending proactive messages as one chat bubble (Gradio 6 format)
+                with self._proactive_lock:
+                    pending, self._proactive_messages = self._proactive_messages, []
+                if pending:
+                    history.append({"role": "assistant", "content": "\n".join(f"*{m}*" for m in pending)})
 
                 # Add user message (Gradio 6 format)
                 history.append({"role": "user", "content": message})
 
-                # Save to memory
-                if self.memory:
-                    self.memory.add_message("user", message)
-
-                # Update proactive engine with activity
-                if self.proactive:
-                    self.proactive.update_presence(True)
-
-                # Get response from provider
-                if self.provider and self._is_connected:
-                    try:
-                        response = await self.provider.get_response(message)
-
-                        # Save response to memory
-                        if self.memory:
-                            self.memory.add_message("assistant", response)
-
-                        # Add assistant response (Gradio 6 format)
-                        history.append({"role": "assistant", "content": response})
-
-                        # Update system prompt with new memory context
-                        self._update_system_prompt()
-                        await self.provider.set_system_prompt(self._system_prompt)
-
-                        # Animate robot response in background (don't block)
-                        Thread(target=self._animate_response, args=(response,), daemon=True).start()
-
-                        # Always generate TTS when voice is enabled
-                        if self._voice_enabled and self.voice:
-                            audio_path = self.voice.synthesize_to_file(response)
-                            logger.info(f"Generated TTS: {audio_path}")
-
-                    except Exception as e:
-                        logger.error(f"Provider error: {e}")
-                        history.append({"role": "assistant", "content": f"*Echo encountered an error: {str(e)}*"})
-                else:
-                    history.append({"role": "assistant", "content": "*Echo is not connected to a language model.*"})
-
-                return "", history, audio_path
-
-            def send_message(message: str, history: list) -> tuple:
-                """Sync wrapper for async send with TTS."""
-                result = run_async(send_message_async(message, history))
-                # Return: (cleared input, updated history, audio path)
-                return result[0], result[1], result[2]
-
-            def process_voice(audio, history: list) -> tuple:
+                # Saved to memory together with the reply at the end of the turn,
+                # or on its own if the turn fails or is cancelled first
+                turn = [("user", message, datetime.now())]
+                try:
+                    # Update proactive engine with activity
+                    if self.proactive:
+                        self.proactive.update_presence(True)
+
+                    # Get response from provider
+                    if self.provider and self._is_connected:
+                        voice = self.voice if self._voice_enabled else None
+                        # Edge TTS spawns an edge-tts process per call, so it gets
+                        # one call for the whole reply instead of one per sentence
+                        per_sentence = voice is not None and voice.backend_name != "edge"
+                        loop = asyncio.get_running_loop()
+                        tts_tasks = []
+                        try:
+                            # Stream the reply into the chat, handing each finished
+                            # sentence to TTS while the rest is still decoding
+                            reply = {"role": "assistant", "content": ""}
+                            history.append(reply)
+                            pending_text = ""
+                            async for chunk in self.provider.stream_response(message):
+                                reply["content"] += chunk
+                                if per_sentence:
+                                    *sentences, pending_text = SENTENCE_END.split(pending_text + chunk)
+                                    for sentence in sentences:
+                                        tts_tasks.append(loop.run_in_executor(self._tts_pool, voice.synthesize, sentence))
+                                yield "", history, gr.update()  # leave the player alone mid-stream
+                            response = reply["content"]
+                            if per_sentence and pending_text.strip():
+                                tts_tasks.append(loop.run_in_executor(self._tts_pool, voice.synthesize, pending_text))
+                            elif voice and not per_sentence:
+                                tts_tasks.append(loop.run_in_executor(self._tts_pool, voice.synthesize, response))
+
+                            # Animate robot response in background (don't block)
+                            self.queue_motion(self._animate_response, response)
+
+                            # Save the turn and refresh the system prompt for the
+                            # next turn while the last clips finish synthesizing
+                            turn.append(("assistant", response, datetime.now()))
+                            saved, turn = turn, None  # owned by _save_turn now; never written twice
+                            clips, _ = await asyncio.gather(asyncio.gather(*tts_tasks), self._save_turn(saved))
+
+                            # Join the per-sentence clips (MP3 frames concatenate cleanly)
+                            if clips:
+                                audio_path = save_audio(b"".join(c for c in clips if c))
+                                logger.info(f"Generated TTS: {audio_path}")
+
+                        except Exception as e:
+                            for task in tts_tasks:
+                                task.cancel()
+                            logger.error(f"Provider error: {e}")
+                            history.append({"role": "assistant", "content": f"*Echo encountered an error: {str(e)}*"})
+                    else:
+                        history.append({"role": "assistant", "content": "*Echo is not connected to a language model.*"})
+                finally:
+                    # No reply was saved with it; still record what the user said
+                    if turn and self.memory:
+                        await asyncio.to_thread(self.memory.add_messages, turn)
+
+                yield "", history, audio_path
+
+            async def process_voice(audio, history: list):
                 """Process voice input: transcribe and get response."""
-                if audio is None:
-                    return history, None, ""
+                if audio is None or not self.voice:
+                    yield history, gr.update(), ""
+                    return
 
-                # Transcribe audio
-                transcript = process_voice_input(audio, self.voice)
+                # Transcribe audio (blocking STT call, can take seconds)
+                transcript = await asyncio.to_thread(process_voice_input, audio, self.voice)
                 if not transcript:
-                    return history, None, "Could not transcribe audio"
-
-                # Get response with TTS
-                _, updated_history, audio_path = run_async(
-                    send_message_async(transcript, history)
-                )
+                    yield history, gr.update(), "Could not transcribe audio"
+                    return
 
-                return updated_history, audio_path, transcript
+                # Stream the response with TTS
+                async for _, updated_history, audio_path in send_message_async(transcript, history):
+                    yield updated_history, audio_path, transcript
 
-            async def change_model_async(model_name: str) -> str:
+            async def change_model(model_name: str) -> str:
                 """Change the active model."""
-                if self.provider:
+                # on_load pushes the current model into the dropdown, which
+                # fires .change too; that must not wipe the shared history
+                if self.provider and model_name != self.provider.config.model:
                     self.provider.config.model = model_name
                     self.provider.clear_history()
                     logger.info(f"Switched to model: {model_name}")
                 return model_name
 
-            def change_model(model_name: str) -> str:
-                """Sync wrapper for model change."""
-                return run_async(change_model_async(model_name))
-
             def toggle_behavior(name: str, enabled: bool) -> None:
                 """Toggle a proactive behavior."""
                 if self.proactive:
@@ -565,29 +710,17 @@ IMPORTANT: Never describe your physical movements, gestures, or body language in
                     self.user_name = None
                 return []
 
-            def refresh_stats() -> str:
-                """Refresh memory stats display."""
-                if self.memory:
-                    stats = self.memory.get_stats()
-                    return f"""
-                        <div class="memory-stat">
-                            <div class="value">{stats['facts']}</div>
-                            <div class="label">Facts</div>
-                        </div>
-                        <div class="memory-stat">
-                            <div class="value">{stats['sessions']}</div>
-                            <div class="label">Sessions</div>
-                        </div>
-                        <div class="memory-stat">
-                            <div class="value">{stats['messages']}</div>
-                            <div class="label">Messages</div>
-                        </div>
-                    </div>
-                </div>
-                    """
-                return ""
-
-            def change_llm_provider(provider: str):
+            def refresh_stats(shown: tuple) -> tuple:
+                """Refresh memory stats display, skipping the update if nothing changed."""
+                if not self.memory:
+                    return "", None
+                stats = self.memory.get_stats()
+                counts = (stats['facts'], stats['sessions'], stats['messages'])
+                if counts == shown:
+                    return gr.update(), shown
+                return render_stats_html(*counts), counts
+
+            async def change_llm_provider(provider: str):
                 """Change the LLM provider and update model list."""
                 # Default models for each provider
                 provider_models = {
@@ -627,7 +760,7 @@ IMPORTANT: Never describe your physical movements, gestures, or body language in
 
                 # Reconnect with new settings
                 try:
-                    run_async(self.provider.connect())
+                    await self.provider.connect()
                     logger.info(f"Switched to {provider}: {default}")
                 except Exception as e:
                     logger.error(f"Failed to connect to {provider}: {e}")
@@ -640,7 +773,7 @@ IMPORTANT: Never describe your physical movements, gestures, or body language in
                     self._voice_enabled = False
                     self._voice_backend = None
                     self.voice = None
-                    return gr.update(choices=[("None", "none")], value="none")
+                    return gr.update(choices=[("None", "none")], value="none"), gr.update(visible=False)
 
                 # Reinitialize voice manager with new backend
                 from .voice import VoiceManager
@@ -678,7 +811,7 @@ IMPORTANT: Never describe your physical movements, gestures, or body language in
                     self._voice_enabled = False
                     logger.warning(f"Failed to connect to voice provider: {provider}")
 
-                return gr.update(choices=choices, value=default)
+                return gr.update(choices=choices, value=default), gr.update(visible=connected)
 
             def change_voice(voice: str):
                 """Change the TTS voice."""
@@ -691,28 +824,47 @@ IMPORTANT: Never describe your physical movements, gestures, or body language in
                     return None
                 return self.voice.synthesize_to_file("Hello! I'm Echo.")
 
+            async def on_load():
+                """Connect the provider on first page load and refresh dependent UI."""
+                await self._ensure_connected()
+                models = self._available_models[:10] if self._available_models else [DEFAULT_MODEL]
+                return self._header_html(), gr.update(choices=models, value=self.provider.config.model)
+
             # Wire up events
+            app.load(on_load, outputs=[header_html, model_dropdown])
+
+            # Chat turns share the provider's single conversation history, so
+            # they queue one at a time across all clients; concurrent turns
+            # would interleave messages. Upstream servers batch on their own.
+            chat_queue = dict(concurrency_id="chat", concurrency_limit=1)
+
             send_btn.click(
-                send_message,
+                send_message_async,
                 inputs=[msg_input, chatbot],
                 outputs=[msg_input, chatbot, audio_output],
+                **chat_queue,
             ).then(
                 refresh_stats,
-                outputs=[memory_html],
+                inputs=[shown_stats],
+                outputs=[memory_html, shown_stats],
             )
 
             msg_input.submit(
-                send_message,
+                send_message_async,
                 inputs=[msg_input, chatbot],
                 outputs=[msg_input, chatbot, audio_output],
+                **chat_queue,
             ).then(
                 refresh_stats,
-                outputs=[memory_html],
+                inputs=[shown_stats],
+                outputs=[memory_html, shown_stats],
             )
 
+            # Switching models clears the history, so not in the middle of a turn
             model_dropdown.change(
                 change_model,
                 inputs=[model_dropdown],
+                **chat_queue,
             )
 
             morning_cb.change(
@@ -739,21 +891,24 @@ IMPORTANT: Never describe your physical movements, gestures, or body language in
             clear_btn.click(clear_chat, outputs=[chatbot])
             forget_btn.click(forget_user, outputs=[chatbot]).then(
                 refresh_stats,
-                outputs=[memory_html],
+                inputs=[shown_stats],
+                outputs=[memory_html, shown_stats],
             )
 
-            # LLM provider change
+            # LLM provider change: reconnecting closes the old client, so
+            # wait for any streaming reply to finish first
             llm_provider_dropdown.change(
                 change_llm_provider,
                 inputs=[llm_provider_dropdown],
                 outputs=[model_dropdown],
+                **chat_queue,
             )
 
             # Voice settings
             voice_provider_dropdown.change(
                 change_voice_provider,
                 inputs=[voice_provider_dropdown],
-                outputs=[voice_dropdown],
+                outputs=[voice_dropdown, voice_tab],
             )
             voice_dropdown.change(
                 change_voice,
@@ -764,16 +919,17 @@ IMPORTANT: Never describe your physical movements, gestures, or body language in
                 outputs=[audio_output],
             )
 
-            # Voice input handling (only if voice is enabled)
-            if self._voice_enabled:
-                audio_input.stop_recording(
-                    process_voice,
-                    inputs=[audio_input, chatbot],
-                    outputs=[chatbot, audio_output, voice_status],
-                ).then(
-                    refresh_stats,
-                    outputs=[memory_html],
-                )
+            # Voice input handling (the tab is shown/hidden with the voice provider)
+            audio_input.stop_recording(
+                process_voice,
+                inputs=[audio_input, chatbot],
+                outputs=[chatbot, audio_output, voice_status],
+                **chat_queue,
+            ).then(
+                refresh_stats,
+                inputs=[shown_stats],
+                outputs=[memory_html, shown_stats],
+            )
 
         return app
 
@@ -964,8 +1120,9 @@ IMPORTANT: Never describe your physical movements, gestures, or body language in
             self.proactive.start()
             logger.info("Proactive engine started")
 
-        while not self.stop_event.is_set():
-            self.stop_event.wait(1.0)  # Check every second
+        # Nothing to do here between events: the UI and proactive engine run
+        # in their own threads, so just block until the daemon stops us
+        self.stop_event.wait()
 
     def _idle_animation(self) -> None:
         """Subtle idle animation."""
@@ -31,11 +31,19 @@ class MemoryManager:
         self.storage = MemoryStorage(data_path)
         self.current_session: Optional[ConversationSession] = None
         self._session_id: Optional[str] = None
+        self._version = 0
+        self._context_cache: Optional[Tuple[int, str]] = None  # (version, build_context())
+
+    @property
+    def version(self) -> int:
+        """Counter bumped whenever build_context() output may have changed."""
+        return self._version
 
     def start_session(self) -> str:
         """Start a new conversation session."""
         self._session_id = f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
         self.current_session = self.storage.start_session(self._session_id)
+        self._version += 1  # can push a summarized session out of the recent window
         logger.info(f"Started memory session: {self._session_id}")
         return self._session_id
 
@@ -51,6 +59,7 @@ class MemoryManager:
                 summary=summary,
                 topics=topics,
             )
+            self._version += 1
             logger.info(f"Ended memory session: {self._session_id}")
 
             self._session_id = None
@@ -58,14 +67,19 @@ class MemoryManager:
 
     def add_message(self, role: str, content: str) -> None:
         """Add a message to current session and extract facts."""
+        self.add_messages([(role, content, datetime.now())])
+
+    def add_messages(self, messages: List[Tuple[str, str, datetime]]) -> None:
+        """Add (role, content, timestamp) messages in one write and extract facts."""
         if not self._session_id:
             self.start_session()
 
-        self.storage.add_message(self._session_id, role, content)
+        self.storage.add_messages(self._session_id, messages)
 
         # Extract and save any facts from user messages
-        if role == "user":
-            self._extract_and_save_facts(content)
+        for role, content, _ in messages:
+            if role == "user":
+                self._extract_and_save_facts(content)
 
     def _extract_and_save_facts(self, content: str) -> None:
         """Extract potential facts from user message."""
@@ -157,6 +171,7 @@ class MemoryManager:
             source="conversation",
         )
         self.storage.save_fact(fact)
+        self._version += 1
         logger.info(f"Remembered: {category}/{key} = {value}")
 
     def recall_fact(self, category: str, key: str) -> Optional[str]:
@@ -172,6 +187,7 @@ class MemoryManager:
         """Forget a specific fact (privacy feature)."""
         deleted = self.storage.delete_fact(category, key)
         if deleted:
+            self._version += 1
             logger.info(f"Forgot: {category}/{key}")
         return deleted
 
@@ -180,6 +196,7 @@ class MemoryManager:
         self.storage.clear_all()
         self._session_id = None
         self.current_session = None
+        self._version += 1
         logger.info("All memory cleared")
 
     # === Context Building ===
@@ -188,8 +205,12 @@ class MemoryManager:
         """
         Build context string for LLM from memories.
 
-        Returns a formatted string to include in system prompt.
+        Returns a formatted string to include in system prompt. Cached until
+        the memory version changes.
         """
+        if self._context_cache and self._context_cache[0] == self._version:
+            return self._context_cache[1]
+
         context_parts = []
 
         # User facts
@@ -209,10 +230,9 @@ class MemoryManager:
                     date_str = session.started_at.strftime("%B %d")
                     context_parts.append(f"- {date_str}: {session.summary}")
 
-        if not context_parts:
-            return ""
-
-        return "\n".join(context_parts)
+        context = "\n".join(context_parts)
+        self._context_cache = (self._version, context)
+        return context
 
     def get_greeting_context(self) -> Tuple[bool, str]:
         """
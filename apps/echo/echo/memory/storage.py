@@ -11,7 +11,7 @@ import sqlite3
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from contextlib import contextmanager
 
 logger = logging.getLogger(__name__)
@@ -281,16 +281,23 @@ class MemoryStorage:
         self, session_id: str, role: str, content: str
     ) -> None:
         """Add a message to a session."""
-        now = datetime.now()
+        self.add_messages(session_id, [(role, content, datetime.now())])
+
+    def add_messages(
+        self, session_id: str, messages: List[Tuple[str, str, datetime]]
+    ) -> None:
+        """Add (role, content, timestamp) messages to a session in one transaction."""
+        if not messages:
+            return
 
         with self._get_connection() as conn:
-            conn.execute(
+            conn.executemany(
                 "INSERT INTO messages (session_id, role, content, timestamp) VALUES (?, ?, ?, ?)",
-                (session_id, role, content, now),
+                [(session_id, role, content, ts) for role, content, ts in messages],
             )
 
-        # Update daily log
-        self._update_daily_log(now, new_message=True)
+            # Update daily log
+            self._update_daily_log(messages[-1][2], new_messages=len(messages), conn=conn)
 
     def get_session_messages(self, session_id: str) -> List[ConversationMessage]:
         """Get all messages from a session."""
@@ -338,32 +345,37 @@ class MemoryStorage:
         self,
         timestamp: datetime,
         new_session: bool = False,
-        new_message: bool = False,
+        new_messages: int = 0,
+        conn: Optional[sqlite3.Connection] = None,
     ) -> None:
-        """Update daily interaction log."""
+        """Update daily interaction log (inside the caller's transaction if conn is given)."""
+        if conn is None:
+            with self._get_connection() as conn:
+                self._update_daily_log(timestamp, new_session, new_messages, conn)
+            return
+
         date_str = timestamp.strftime("%Y-%m-%d")
 
-        with self._get_connection() as conn:
-            # Upsert daily log
-            conn.execute(
-                """
-                INSERT INTO daily_log (date, first_seen, last_seen, session_count, total_messages)
-                VALUES (?, ?, ?, ?, ?)
-                ON CONFLICT(date) DO UPDATE SET
-                    last_seen = excluded.last_seen,
-                    session_count = daily_log.session_count + ?,
-                    total_messages = daily_log.total_messages + ?
-                """,
-                (
-                    date_str,
-                    timestamp,
-                    timestamp,
-                    1 if new_session else 0,
-                    1 if new_message else 0,
-                    1 if new_session else 0,
-                    1 if new_message else 0,
-                ),
-            )
+        # Upsert daily log
+        conn.execute(
+            """
+            INSERT INTO daily_log (date, first_seen, last_seen, session_count, total_messages)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(date) DO UPDATE SET
+                last_seen = excluded.last_seen,
+                session_count = daily_log.session_count + ?,
+                total_messages = daily_log.total_messages + ?
+            """,
+            (
+                date_str,
+                timestamp,
+                timestamp,
+                1 if new_session else 0,
+                new_messages,
+                1 if new_session else 0,
+                new_messages,
+            ),
+        )
 
     def has_greeted_today(self) -> bool:
         """Check if we've greeted the user today."""
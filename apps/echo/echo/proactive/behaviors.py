@@ -38,6 +38,9 @@ class Behavior(ABC):
         """
         Execute the behavior.
 
+        Runs on the proactive engine's thread: queue robot motion with
+        echo.queue_motion rather than calling echo.reachy directly.
+
         Args:
             echo: The Echo app instance for robot control and state access
 
@@ -75,27 +78,7 @@ class MorningGreetingBehavior(Behavior):
 
         # Animate greeting
         if echo.reachy:
-            try:
-                # Wake up animation
-                echo.reachy.goto_target(
-                    antennas=[0.6, 0.6],
-                    duration=0.4,
-                )
-                # Happy wiggle
-                echo.reachy.goto_target(
-                    antennas=[0.4, 0.7],
-                    duration=0.2,
-                )
-                echo.reachy.goto_target(
-                    antennas=[0.7, 0.4],
-                    duration=0.2,
-                )
-                echo.reachy.goto_target(
-                    antennas=[0.5, 0.5],
-                    duration=0.3,
-                )
-            except Exception as e:
-                logger.warning(f"Greeting animation failed: {e}")
+            echo.queue_motion(self._animate, echo.reachy)
 
         # Mark as greeted
         if echo.memory:
@@ -107,6 +90,30 @@ class MorningGreetingBehavior(Behavior):
             data={"type": "morning_greeting"},
         )
 
+    def _animate(self, reachy) -> None:
+        """Greeting animation, played on Echo's motion thread."""
+        try:
+            # Wake up animation
+            reachy.goto_target(
+                antennas=[0.6, 0.6],
+                duration=0.4,
+            )
+            # Happy wiggle
+            reachy.goto_target(
+                antennas=[0.4, 0.7],
+                duration=0.2,
+            )
+            reachy.goto_target(
+                antennas=[0.7, 0.4],
+                duration=0.2,
+            )
+            reachy.goto_target(
+                antennas=[0.5, 0.5],
+                duration=0.3,
+            )
+        except Exception as e:
+            logger.warning(f"Greeting animation failed: {e}")
+
     def _build_greeting(self, echo: "ReachyMiniEcho") -> str:
         """Build personalized greeting message."""
         now = datetime.now()
@@ -170,28 +177,7 @@ class WorkBreakReminderBehavior(Behavior):
 
         # Animate gentle interruption
         if echo.reachy:
-            try:
-                # Get attention animation
-                echo.reachy.goto_target(
-                    antennas=[0.3, 0.3],
-                    duration=0.3,
-                )
-                # Gentle head tilt
-                echo.reachy.goto_target(
-                    head={"roll": 10},
-                    duration=0.4,
-                )
-                echo.reachy.goto_target(
-                    head={"roll": 0},
-                    duration=0.4,
-                )
-                # Inviting antenna gesture
-                echo.reachy.goto_target(
-                    antennas=[0.5, 0.5],
-                    duration=0.3,
-                )
-            except Exception as e:
-                logger.warning(f"Break reminder animation failed: {e}")
+            echo.queue_motion(self._animate, echo.reachy)
 
         return BehaviorResult(
             success=True,
@@ -199,6 +185,31 @@ class WorkBreakReminderBehavior(Behavior):
             data={"type": "work_break"},
         )
 
+    def _animate(self, reachy) -> None:
+        """Break reminder animation, played on Echo's motion thread."""
+        try:
+            # Get attention animation
+            reachy.goto_target(
+                antennas=[0.3, 0.3],
+                duration=0.3,
+            )
+            # Gentle head tilt
+            reachy.goto_target(
+                head={"roll": 10},
+                duration=0.4,
+            )
+            reachy.goto_target(
+                head={"roll": 0},
+                duration=0.4,
+            )
+            # Inviting antenna gesture
+            reachy.goto_target(
+                antennas=[0.5, 0.5],
+                duration=0.3,
+            )
+        except Exception as e:
+            logger.warning(f"Break reminder animation failed: {e}")
+
 
 class BuildCelebrationBehavior(Behavior):
     """
@@ -228,33 +239,7 @@ class BuildCelebrationBehavior(Behavior):
 
         # Celebration animation
         if echo.reachy:
-            try:
-                # Excited antenna dance
-                for _ in range(2):
-                    echo.reachy.goto_target(
-                        antennas=[0.8, 0.2],
-                        duration=0.15,
-                    )
-                    echo.reachy.goto_target(
-                        antennas=[0.2, 0.8],
-                        duration=0.15,
-                    )
-
-                # Victory pose
-                echo.reachy.goto_target(
-                    antennas=[0.7, 0.7],
-                    head={"z": 5},  # Head up slightly
-                    duration=0.3,
-                )
-
-                # Return to neutral
-                echo.reachy.goto_target(
-                    antennas=[0.3, 0.3],
-                    head={"z": 0},
-                    duration=0.4,
-                )
-            except Exception as e:
-                logger.warning(f"Celebration animation failed: {e}")
+            echo.queue_motion(self._animate, echo.reachy)
 
         return BehaviorResult(
             success=True,
@@ -262,6 +247,36 @@ class BuildCelebrationBehavior(Behavior):
             data={"type": "build_celebration"},
         )
 
+    def _animate(self, reachy) -> None:
+        """Celebration animation, played on Echo's motion thread."""
+        try:
+            # Excited antenna dance
+            for _ in range(2):
+                reachy.goto_target(
+                    antennas=[0.8, 0.2],
+                    duration=0.15,
+                )
+                reachy.goto_target(
+                    antennas=[0.2, 0.8],
+                    duration=0.15,
+                )
+
+            # Victory pose
+            reachy.goto_target(
+                antennas=[0.7, 0.7],
+                head={"z": 5},  # Head up slightly
+                duration=0.3,
+            )
+
+            # Return to neutral
+            reachy.goto_target(
+                antennas=[0.3, 0.3],
+                head={"z": 0},
+                duration=0.4,
+            )
+        except Exception as e:
+            logger.warning(f"Celebration animation failed: {e}")
+
 
 class BuildFailureSupportBehavior(Behavior):
     """
@@ -290,21 +305,7 @@ class BuildFailureSupportBehavior(Behavior):
 
         # Sympathetic animation
         if echo.reachy:
-            try:
-                # Sympathetic droop
-                echo.reachy.goto_target(
-                    antennas=[0.1, 0.1],
-                    head={"roll": -5},
-                    duration=0.5,
-                )
-                # Supportive recovery
-                echo.reachy.goto_target(
-                    antennas=[0.3, 0.3],
-                    head={"roll": 0},
-                    duration=0.4,
-                )
-            except Exception as e:
-                logger.warning(f"Failure support animation failed: {e}")
+            echo.queue_motion(self._animate, echo.reachy)
 
         return BehaviorResult(
             success=True,
@@ -312,6 +313,24 @@ class BuildFailureSupportBehavior(Behavior):
             data={"type": "build_failure"},
         )
 
+    def _animate(self, reachy) -> None:
+        """Failure support animation, played on Echo's motion thread."""
+        try:
+            # Sympathetic droop
+            reachy.goto_target(
+                antennas=[0.1, 0.1],
+                head={"roll": -5},
+                duration=0.5,
+            )
+            # Supportive recovery
+            reachy.goto_target(
+                antennas=[0.3, 0.3],
+                head={"roll": 0},
+                duration=0.4,
+            )
+        except Exception as e:
+            logger.warning(f"Failure support animation failed: {e}")
+
 
 class ReturnGreetingBehavior(Behavior):
     """
@@ -340,27 +359,7 @@ class ReturnGreetingBehavior(Behavior):
 
         # Welcome animation
         if echo.reachy:
-            try:
-                # Perk up
-                echo.reachy.goto_target(
-                    antennas=[0.5, 0.5],
-                    duration=0.3,
-                )
-                # Little wave
-                echo.reachy.goto_target(
-                    antennas=[0.6, 0.3],
-                    duration=0.2,
-                )
-                echo.reachy.goto_target(
-                    antennas=[0.3, 0.6],
-                    duration=0.2,
-                )
-                echo.reachy.goto_target(
-                    antennas=[0.4, 0.4],
-                    duration=0.3,
-                )
-            except Exception as e:
-                logger.warning(f"Return greeting animation failed: {e}")
+            echo.queue_motion(self._animate, echo.reachy)
 
         return BehaviorResult(
             success=True,
@@ -368,6 +367,30 @@ class ReturnGreetingBehavior(Behavior):
             data={"type": "return_greeting"},
         )
 
+    def _animate(self, reachy) -> None:
+        """Return greeting animation, played on Echo's motion thread."""
+        try:
+            # Perk up
+            reachy.goto_target(
+                antennas=[0.5, 0.5],
+                duration=0.3,
+            )
+            # Little wave
+            reachy.goto_target(
+                antennas=[0.6, 0.3],
+                duration=0.2,
+            )
+            reachy.goto_target(
+                antennas=[0.3, 0.6],
+                duration=0.2,
+            )
+            reachy.goto_target(
+                antennas=[0.4, 0.4],
+                duration=0.3,
+            )
+        except Exception as e:
+            logger.warning(f"Return greeting animation failed: {e}")
+
 
 # === Behavior registry ===
 
@@ -253,12 +253,12 @@ class ProactiveEngine:
     def _fire_behavior(self, reg: RegisteredBehavior) -> None:
         """Execute a behavior."""
         try:
-            # Run async behavior in the event loop
-            future = asyncio.run_coroutine_threadsafe(
-                reg.behavior.execute(self.echo),
-                self._event_loop,
+            # Run async behavior on this thread's loop. (It was submitted with
+            # run_coroutine_threadsafe before, but nothing ever ran the loop,
+            # so every behavior just timed out.)
+            result = self._event_loop.run_until_complete(
+                asyncio.wait_for(reg.behavior.execute(self.echo), timeout=10.0)
             )
-            result = future.result(timeout=10.0)
 
             if result.success:
                 reg.mark_fired()
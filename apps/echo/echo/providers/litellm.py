@@ -11,6 +11,7 @@ import os
 from dataclasses import dataclass, field
 from typing import AsyncIterator, List, Optional
 
+import httpx
 from openai import AsyncOpenAI
 
 from .base import LLMProvider, ProviderCapability, ProviderCapabilities, Response
@@ -22,6 +23,11 @@ DEFAULT_LITELLM_URL = "https://openrouter.ai/api"
 DEFAULT_API_KEY = os.getenv("OPENROUTER_API_KEY") or os.getenv("LITELLM_API_KEY", "")
 DEFAULT_MODEL = "google/gemini-2.5-flash-lite"
 
+# Fail fast on an unreachable endpoint. The 60 s applies to each read, write
+# and pool wait separately (not the whole request), so a slow stream that
+# keeps sending chunks is never cut off
+REQUEST_TIMEOUT = httpx.Timeout(60.0, connect=3.0)
+
 
 @dataclass
 class LiteLLMConfig:
@@ -64,10 +70,16 @@ class LiteLLMProvider(LLMProvider):
                 "X-Title": "Reachy Echo",
             }
 
+        # One client (and HTTP connection pool) per connection; release the
+        # previous one when reconnecting with new settings
+        if self._client:
+            await self._client.close()
+
         self._client = AsyncOpenAI(
             base_url=f"{self.config.base_url}/v1",
             api_key=self.config.api_key or "not-needed",
             default_headers=extra_headers,
+            timeout=REQUEST_TIMEOUT,
         )
 
         # Test connection by listing models
@@ -89,6 +101,8 @@ class LiteLLMProvider(LLMProvider):
 
     async def disconnect(self) -> None:
         """Clean up client."""
+        if self._client:
+            await self._client.close()
         self._client = None
         self._conversation_history = []
         logger.info("LiteLLM disconnected")
@@ -180,6 +194,22 @@ class LiteLLMProvider(LLMProvider):
         self._conversation_history = []
         logger.debug("Conversation history cleared")
 
+    async def stream_response(self, text: str) -> AsyncIterator[str]:
+        """
+        Convenience method: send text and yield response text as it arrives.
+
+        Args:
+            text: User message
+
+        Yields:
+            Response text chunks
+        """
+        await self.send_text(text)
+
+        async for response in self.receive_responses():
+            if response.text:
+                yield response.text
+
     async def get_response(self, text: str) -> str:
         """
         Convenience method: send text and get full response.
@@ -190,12 +220,9 @@ class LiteLLMProvider(LLMProvider):
         Returns:
             Complete assistant response
         """
-        await self.send_text(text)
-
         full_response = ""
-        async for response in self.receive_responses():
-            if response.text:
-                full_response += response.text
+        async for chunk in self.stream_response(text):
+            full_response += chunk
 
         return full_response
 
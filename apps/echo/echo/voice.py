@@ -583,19 +583,34 @@ def process_voice_input(audio: Tuple[int, np.ndarray], voice_manager: VoiceManag
 
     sample_rate, audio_array = audio
 
-    # Convert to mono if stereo
-    if len(audio_array.shape) > 1:
-        audio_array = audio_array.mean(axis=1)
-
-    # Normalize if needed
-    if audio_array.dtype == np.int16:
-        audio_array = audio_array.astype(np.float32) / 32768.0
-    elif audio_array.dtype == np.int32:
-        audio_array = audio_array.astype(np.float32) / 2147483648.0
+    # Convert to mono if stereo, keeping the sample format
+    if audio_array.ndim > 1:
+        audio_array = audio_array.mean(axis=1).astype(audio_array.dtype, copy=False)
 
+    # Integer PCM (Gradio records int16) goes to the WAV writer as-is;
+    # scaling to float here would only be converted back to int16 there
     return voice_manager.transcribe_array(audio_array, sample_rate)
 
 
+def save_audio(audio_bytes: bytes) -> Optional[str]:
+    """
+    Write synthesized audio to a temp file for Gradio playback.
+
+    Args:
+        audio_bytes: MP3 data (all backends synthesize MP3)
+
+    Returns:
+        Path to the audio file, or None if there is no audio
+    """
+    if not audio_bytes:
+        return None
+
+    fd, path = tempfile.mkstemp(suffix=".mp3")
+    with os.fdopen(fd, "wb") as f:
+        f.write(audio_bytes)
+    return path
+
+
 def generate_voice_response(text: str, voice_manager: VoiceManager) -> Optional[str]:
     """
     Generate audio response for Gradio playback.
@@ -5,16 +5,12 @@ Pre-built animations for Reachy Mini using the real SDK.
 import time
 import logging
 
-logger = logging.getLogger(__name__)
-
+try:
+    from reachy_mini.utils import create_head_pose
+except ImportError:
+    create_head_pose = None
 
-def _get_head_pose_func():
-    """Get the create_head_pose function if available."""
-    try:
-        from reachy_mini.utils import create_head_pose
-        return create_head_pose
-    except ImportError:
-        return None
+logger = logging.getLogger(__name__)
 
 
 def victory_dance(robot, duration: float = 3.0):
@@ -23,7 +19,6 @@ def victory_dance(robot, duration: float = 3.0):
     """
     logger.info("Performing victory dance!")
 
-    create_head_pose = _get_head_pose_func()
     if create_head_pose is None:
         logger.warning("reachy_mini not available, skipping animation")
         return
@@ -60,7 +55,6 @@ def disappointed_shake(robot, intensity: float = 1.0):
     """
     logger.info(f"Disappointed shake (intensity: {intensity})")
 
-    create_head_pose = _get_head_pose_func()
     if create_head_pose is None:
         logger.warning("reachy_mini not available, skipping animation")
         return
@@ -121,7 +115,6 @@ def focus_mode_enter(robot):
     """Animation when entering focus mode."""
     logger.info("Entering focus mode")
 
-    create_head_pose = _get_head_pose_func()
     if create_head_pose is None:
         logger.warning("reachy_mini not available, skipping animation")
         return
@@ -139,7 +132,6 @@ def focus_mode_exit(robot):
     """Animation when exiting focus mode."""
     logger.info("Exiting focus mode")
 
-    create_head_pose = _get_head_pose_func()
     if create_head_pose is None:
         logger.warning("reachy_mini not available, skipping animation")
         return